@@ -1,14 +1,17 @@
 import pandas as pd
 from tqdm import tqdm
-import shapely
-import skyfield
+import skyfield.api
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 
 # Define types
 DataFrame = pd.DataFrame
 EarthSatellite = skyfield.api.EarthSatellite
 
+# Build the timescale once: load.timescale() re-parses its data files,
+# which is pure setup cost when repeated on every ground_path() call
+_TIMESCALE = skyfield.api.load.timescale()
+
 
 def ground_path(satellite:EarthSatellite, date_from:datetime, date_to:datetime, freq:int=60) -> DataFrame:
     """
@@ -26,16 +29,26 @@ def ground_path(satellite:EarthSatellite, date_from:datetime, date_to:datetime,
     df : DataFrame
     """
 
+    # Normalize tz-aware inputs to naive UTC, so both the TT conversion
+    # and the DataFrame index interpret them the same way
+    if date_from.tzinfo is not None:
+        date_from = date_from.astimezone(timezone.utc).replace(tzinfo=None)
+    if date_to.tzinfo is not None:
+        date_to = date_to.astimezone(timezone.utc).replace(tzinfo=None)
+
     # Build time array
+    # (convert date_from to TT once, then add regular offsets: this
+    # skips skyfield's per-element UTC parsing and delta-T lookups)
     td = (date_to - date_from)
-    seconds = date_from.second + np.arange(0, td.total_seconds(), freq)
-    ts = skyfield.api.load.timescale()
-    time_array = ts.utc(year=date_from.year, 
-                        month=date_from.month, 
-                        day=date_from.day, 
-                        hour=date_from.hour, 
-                        minute=date_from.minute, 
-                        second=seconds)
+    seconds = np.arange(0, td.total_seconds(), freq)
+    ts = _TIMESCALE
+    jd0 = ts.utc(date_from.year,
+                 date_from.month,
+                 date_from.day,
+                 date_from.hour,
+                 date_from.minute,
+                 date_from.second).tt
+    time_array = ts.tt_jd(jd0 + seconds / 86400.0)
 
     # Perform EarthSatellite.at() orbit propagation
     sat_propagated = satellite.at(time_array)
@@ -49,24 +62,32 @@ def ground_path(satellite:EarthSatellite, date_from:datetime, date_to:datetime,
     lon = subpoint.longitude.degrees
     elevation = subpoint.elevation.km
 
-    # Convert to DataFrame
+    # Mark ascending and descending nodes
+    # (one numpy pass over lat instead of shift/fillna Series temporaries)
+    lat_next = np.empty_like(lat)
+    lat_next[:-1] = lat[1:]
+    lat_next[-1:] = 0
+    ascending = (lat >= 0) & (lat_next >= 0)
+
+    # Calculate orbit
+    # (increment every time the satellite crosses equator on ascending node)
+    asc_int = ascending.astype(np.int8)
+    orbit = np.cumsum(np.diff(asc_int, prepend=asc_int[:1]) == 1)
+
+    # Convert to DataFrame in a single construction, indexed directly
+    # on the regular time grid (no Julian-date round trip, no set_index
+    # or per-column assignment afterwards)
+    index = pd.Timestamp(date_from, tz='UTC') + pd.to_timedelta(seconds, unit='s')
     df = pd.DataFrame({
-        'datetime': time_array.utc_datetime(),
         'X': position_gcrs[0],
         'Y': position_gcrs[1],
         'Z': position_gcrs[2],
         'lat': lat,
         'lon': lon,
-        'elevation': elevation
-    })
-    df.set_index('datetime', inplace=True)
-    
-    # Mark ascending and descending nodes
-    df['ascending'] = (df['lat'] >= 0) & (df['lat'].shift(-1).fillna(0) >= 0)
-    
-    # Calculate orbit
-    # (increment every time the satellite crosses equator on ascending node)
-    df['orbit'] = (df['ascending'].astype(int).diff() == 1).cumsum()
+        'elevation': elevation,
+        'ascending': ascending,
+        'orbit': orbit
+    }, index=index.rename('datetime'))
 
     return df
 
@@ -101,20 +122,19 @@ def ltan_raan(df: DataFrame) -> DataFrame:
     ----------
     df_ltan : DataFrame
     """
-    df_nodes = get_nodes(df)
-    df_ltan = df_nodes[df_nodes['ascending'] == True].copy()
-
-    for idx, row in df_ltan.iterrows():
-        h = (row['lon'] * 24) / 360
-        
-        # calculate local time by subtracting the difference from UTC+0
-        local_datetime = idx.replace(tzinfo=None) + timedelta(hours=h)
-        local_time = timedelta(hours=local_datetime.hour, 
-                               minutes=local_datetime.minute, 
-                               seconds=local_datetime.second,
-                               microseconds=local_datetime.microsecond) 
-        df_ltan.loc[idx, 'local_time'] = local_time
-        
+    # combine the node and ascending filters into a single mask
+    # so the DataFrame is sliced (and copied) only once
+    asc = df['ascending'].to_numpy()
+    nodes = np.zeros(len(df), dtype=bool)
+    nodes[1:] = asc[1:] != asc[:-1]
+    df_ltan = df[nodes & asc].copy()
+
+    # calculate local time by subtracting the difference from UTC+0
+    # (vectorized over all nodes instead of iterating row by row)
+    delta = pd.to_timedelta(df_ltan['lon'].to_numpy() * 24 / 360, unit='h')
+    local_datetime = df_ltan.index.tz_localize(None) + delta
+    df_ltan['local_time'] = local_datetime - local_datetime.normalize()
+
     df_ltan['raan'] = (np.rad2deg(np.arctan2(df_ltan['Y'], df_ltan['X'])) + 360) % 360
        
     return df_ltan
\ No newline at end of file
@@ -1,4 +1,5 @@
 import cartopy
+import numpy as np
 import pandas as pd
 from solar_utils import daynight_grid, sun_pos
 import matplotlib
@@ -20,7 +21,10 @@ def plot_daynight(ax:AxesSubplot, dt:datetime, transform:Any) -> AxesSubplot:
     ax.add_patch(sun)
 
     # draw daynight
-    lons,lats,daynight = daynight_grid(date=dt, delta=0.25, lonmin=-180, lonmax=180)
+    # (truncate to the minute so frames within the same minute share
+    # one cached grid; the terminator moves ~0.25 deg/min, i.e. at most
+    # one grid cell per minute of truncation - not visible at this scale)
+    lons,lats,daynight = daynight_grid(date=dt.replace(second=0, microsecond=0), delta=0.25, lonmin=-180, lonmax=180)
     ax.contourf(lons, lats, daynight, 1, colors=['k'], alpha=0.5, transform=transform)
     
     return ax
@@ -43,15 +47,28 @@ def plot_ground_path(ax:AxesSubplot, df:DataFrame, transform:Any, daynight:bool=
     # add basemap, coastlines and borders
     plot_map_features(ax)
     
-    # color generator
-    NUM_COLORS = len(df['orbit'].unique())
+    # resolve the orbit list once; categorical columns already store it
+    if isinstance(df['orbit'].dtype, pd.CategoricalDtype):
+        orbits = df['orbit'].cat.categories
+    else:
+        orbits = df['orbit'].unique()
+
+    # color per orbit
+    NUM_COLORS = len(orbits)
     cm = plt.cm.get_cmap(cmap)
-    cgen = (cm(1.*i/NUM_COLORS) for i in range(NUM_COLORS))
-    
-    # plot orbits
-    for orbit in df['orbit'].unique():
-        mask = df['orbit'] == orbit
-        ax.plot(df[mask]['lon'], df[mask]['lat'], color=next(cgen), label='Orbit {:}'.format(orbit), transform=transform)
+    colors = [cm(1.*i/NUM_COLORS) for i in range(NUM_COLORS)]
+
+    # plot orbits as a single LineCollection
+    # (one artist and one cartopy transform instead of one ax.plot per orbit)
+    points = np.column_stack([df['lon'].to_numpy(), df['lat'].to_numpy()])
+    breaks = np.where(np.diff(df['orbit'].to_numpy()) != 0)[0] + 1
+    segments = np.split(points, breaks)
+    lc = matplotlib.collections.LineCollection(segments, colors=colors, transform=transform)
+    ax.add_collection(lc)
+
+    # empty proxy lines keep the per-orbit legend entries
+    for orbit, color in zip(orbits, colors):
+        ax.plot([], [], color=color, label='Orbit {:}'.format(orbit))
     
     # plot satellite starting position
     start_pos = plt.Circle((df.iloc[0]['lon'], df.iloc[0]['lat']), 2, facecolor='green', edgecolor='black', alpha=0.5, transform=transform, zorder=99, label='Start')
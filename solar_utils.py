@@ -1,6 +1,7 @@
 from __future__ import (absolute_import, division, print_function)
 
 # some simple functions to calculate solar position, day-night terminator
+import functools
 import numpy as np
 from numpy import ma
 from datetime import datetime
@@ -109,10 +110,14 @@ def daynight_terminator(date, delta, lonmin, lonmax):
     return lons, lats, tau, dec
 
 
+@functools.lru_cache(maxsize=128)
 def daynight_grid(date, delta, lonmin, lonmax):
     """
     date is datetime object (assumed UTC).
-    delta is the grid interval (in degrees) used to compute terminator."""
+    delta is the grid interval (in degrees) used to compute terminator.
+
+    Results are memoized per (date, delta, lonmin, lonmax), so repeated
+    plots of the same moment (e.g. animation frames) reuse the grid."""
     lons, lats, tau, dec = daynight_terminator(date, delta, lonmin, lonmax)
     # create day/night grid (1 for night, 0 for day)
     lats2 = np.arange(-90,90+0.5*delta,delta,dtype=np.float32)